@@ -8,7 +8,15 @@ import sys
 import re
 import csv
 import time
+import json
+import queue
+import multiprocessing
 import random
+import shutil
+import itertools
+import asyncio
+import functools
+from dataclasses import dataclass
 from datetime import datetime
 from urllib.parse import quote_plus
 
@@ -24,61 +32,361 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
     WebDriverException,
 )
 
+from cache import ProfileCache
+
+# Optional fast path: plain HTTP fetches without a browser
+try:
+    import aiohttp
+    from selectolax.parser import HTMLParser
+
+    ASYNC_HTTP_AVAILABLE = True
+except ImportError:
+    ASYNC_HTTP_AVAILABLE = False
+
+# Optional browser engine: async Chromium without Selenium's
+# per-command HTTP hop (needs a one-time `playwright install chromium`)
+try:
+    from playwright.async_api import async_playwright
+
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+# Optional fast JSON serializer for the JSONL output
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False)
+
+
 # Configuration
 SEARCH_QUERY = os.getenv("SEARCH_QUERY", "site:linkedin.com/in/ software engineer")
 OUTPUT_FILE = os.getenv("OUTPUT_FILE", "linkedin_profiles.csv")
 MAX_RESULTS = 30
 USE_TIMESTAMP = os.getenv("USE_TIMESTAMP", "false").lower() == "true"
+# Also emit results as JSON Lines — append-safe, no quoting logic per row
+OUTPUT_JSONL = os.getenv("OUTPUT_JSONL", "false").lower() == "true"
 
+# Persistent profile cache: steady-state runs serve known profiles from
+# disk instead of re-querying the search engines
+USE_PROFILE_CACHE = os.getenv("USE_PROFILE_CACHE", "true").lower() == "true"
+CACHE_MAX_AGE_HOURS = int(os.getenv("CACHE_MAX_AGE_HOURS", "24"))
 
-def setup_driver(headless=True):
-    """Configure and return Chrome WebDriver"""
-    chrome_options = Options()
+# Output column order, shared by every writer; profile rows are plain
+# tuples in this order — far lighter than a dict per row
+CSV_FIELDS = ("title", "link", "scraped_at")
+
+
+@dataclass(slots=True, frozen=True)
+class Profile:
+    """One scraped search result row.
+
+    Slots keep the per-row footprint close to a tuple's, and frozen
+    makes rows hashable so they can sit in sets directly.
+    """
+
+    title: str
+    link: str
+    scraped_at: str
+
+
+# Marker every profile URL must contain; shared by the Python validators
+# and the in-page JS filters
+_LINKEDIN_PREFIX = "linkedin.com/in/"
+
+# Compiled once — these run on every candidate link
+_LINKEDIN_RE = re.compile(r"(https?://[a-z]{2,3}\.?linkedin\.com/in/[a-zA-Z0-9_-]+)")
+# Result title + LinkedIn href in one C-level scan of the raw HTML; Bing
+# nests the anchor inside the <h2> and highlights query terms with
+# nested <strong> tags, so the title runs to </a> and is de-tagged after
+_URL_WITH_TITLE_RE = re.compile(
+    r'<h2[^>]*>\s*<a[^>]+href="(?P<url>[^"]*linkedin\.com/in/[^"]*)"[^>]*>'
+    r"(?P<title>.{5,300}?)</a>",
+    re.DOTALL,
+)
+# Strips the highlight markup out of a captured title
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Google/Bing tracking or search URLs that disqualify a link — one
+# compiled alternation so validation is a single scan, not one per pattern
+_INVALID_RE = re.compile(r"google\.com|bing\.com|/search\?|udm=|source=lnms|source=lnt")
+
+# Navigation/UI noise, pre-lowered for a single set lookup per title
+_NOISE_TITLES = frozenset(
+    {
+        "ai mode",
+        "images",
+        "videos",
+        "forums",
+        "short videos",
+        "read more",
+        "see more",
+        "view all",
+        "more results",
+        "next",
+        "previous",
+        "linkedin profile",  # Generic placeholder, get real names
+    }
+)
+
+# Max concurrent HTTP fetches when scraping without a browser
+FETCH_CONCURRENCY = 10
+
+# Connections kept to chromedriver so parallel commands don't serialize
+COMMAND_POOL_MAXSIZE = 20
+
+# Where the resolved chromedriver path is memoized between runs
+DRIVER_CACHE_DIR = os.path.expanduser("~/.cache/linkedin_scraper")
+
+# Persistent browser reuse across runs (opt-in)
+KEEP_BROWSER = os.getenv("KEEP_BROWSER", "false").lower() == "true"
+POOL_STATE_FILE = os.getenv("CHROME_POOL_STATE", "/tmp/chrome_pool.json")
+CHROME_PROFILE_DIR = "/tmp/chrome-profile-0"
+DEBUGGER_ADDRESS = "127.0.0.1:9222"
+
+# Non-document resources blocked at the CDP level — we only need the HTML
+BLOCKED_RESOURCE_URLS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.css",
+    "*.woff",
+    "*.woff2",
+    "*.svg",
+    "*.webp",
+    "*.mp4",
+    "*/analytics*",
+    "*/beacon*",
+]
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+]
+
+
+def _load_pool_state():
+    """Read the persisted debugging endpoint of a still-running Chrome"""
+    try:
+        with open(POOL_STATE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _save_pool_state(executor_url, debug_port=None):
+    """Persist the endpoint so the next run can reattach instead of cold-starting"""
+    address = f"127.0.0.1:{debug_port}" if debug_port else DEBUGGER_ADDRESS
+    try:
+        with open(POOL_STATE_FILE, "w") as f:
+            json.dump(
+                {
+                    "executor_url": executor_url,
+                    "debugger_address": address,
+                },
+                f,
+            )
+    except OSError:
+        pass
+
+
+def _clear_pool_state():
+    try:
+        os.remove(POOL_STATE_FILE)
+    except OSError:
+        pass
+
+
+def _cached_chromedriver():
+    """Resolve a chromedriver binary via webdriver-manager, memoized on disk.
+
+    webdriver-manager re-checks the online version catalog on every
+    install; caching the resolved path (and pinning the version) makes
+    repeat runs skip the HTTP lookup entirely.
+    """
+    cache_file = os.path.join(DRIVER_CACHE_DIR, "chromedriver_path")
+
+    try:
+        with open(cache_file) as f:
+            path = f.read().strip()
+        if path and os.path.isfile(path):
+            return path
+    except OSError:
+        pass
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager(
+        driver_version=os.getenv("CHROME_DRIVER_VERSION") or None
+    ).install()
+
+    try:
+        os.makedirs(DRIVER_CACHE_DIR, exist_ok=True)
+        with open(cache_file, "w") as f:
+            f.write(path)
+    except OSError:
+        pass
+
+    return path
+
+
+def _widen_command_pool(driver, maxsize=COMMAND_POOL_MAXSIZE):
+    """Enlarge the urllib3 pool behind the WebDriver HTTP client.
+
+    Selenium's default pool holds a single connection, so concurrent
+    commands (multi-tab scraping, watchdog threads) serialize behind it
+    and log "Connection pool is full".
+    """
+    try:
+        import urllib3
+
+        executor = driver.command_executor
+        executor._conn = urllib3.PoolManager(maxsize=maxsize, block=True)
+    except (ImportError, AttributeError):
+        # Private layout changed; fall back to the default pool
+        pass
+
+
+def _reconnect_driver():
+    """Try to reattach to a Chrome left running by a previous run"""
+    state = _load_pool_state()
+    if not state:
+        return None
+
+    reattach_options = Options()
+    reattach_options.add_experimental_option(
+        "debuggerAddress", state["debugger_address"]
+    )
+    try:
+        driver = webdriver.Remote(
+            command_executor=state["executor_url"], options=reattach_options
+        )
+        _widen_command_pool(driver)
+        # Reset state instead of paying a fresh browser start
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+        driver.implicitly_wait(0)
+        return driver
+    except WebDriverException:
+        _clear_pool_state()
+        return None
+
+
+@functools.lru_cache(maxsize=2)
+def _base_arguments(headless):
+    """Static Chrome arguments, computed once per headless mode.
+
+    Options objects are mutable, so the cache holds the argument tuple
+    and _build_options assembles a fresh Options from it each call.
+    """
+    args = []
 
     if headless:
-        chrome_options.add_argument("--headless=new")
+        args.append("--headless=new")
 
     # Essential for GitHub Actions
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    chrome_options.add_argument("--disable-extensions")
-    chrome_options.add_argument("--disable-plugins")
-    chrome_options.add_argument("--disable-images")
-    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-    chrome_options.add_argument("--remote-debugging-port=9222")
-
-    # Randomize user agent
-    user_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    args += [
+        "--no-sandbox",
+        "--disable-dev-shm-usage",
+        "--disable-gpu",
+        "--window-size=1920,1080",
+        "--disable-extensions",
+        "--disable-plugins",
+        "--disable-images",
+        "--disable-blink-features=AutomationControlled",
     ]
-    chrome_options.add_argument(f"--user-agent={random.choice(user_agents)}")
+
+    # Fixed profile dir so a kept-alive Chrome can be reattached to later
+    if KEEP_BROWSER:
+        args.append(f"--user-data-dir={CHROME_PROFILE_DIR}")
+
+    return tuple(args)
+
+
+# Every Chrome needs its own DevTools port or the second one fails to
+# start; the pool state records whichever port the kept-alive Chrome
+# actually got, so reattach follows it
+_DEBUG_PORT_BASE = 9222
+_debug_port_counter = itertools.count()
+
+
+def _next_debug_port():
+    """Distinct port per driver, with pool workers in their own range"""
+    ident = multiprocessing.current_process()._identity
+    base = _DEBUG_PORT_BASE + 100 * ident[0] if ident else _DEBUG_PORT_BASE
+    return base + next(_debug_port_counter)
+
+
+def _build_options(headless=True, enable_js=False, debug_port=None):
+    """Assemble Chrome Options; only the user agent varies per call"""
+    chrome_options = Options()
+
+    for arg in _base_arguments(headless):
+        chrome_options.add_argument(arg)
+
+    # Per-driver DevTools port (kept out of the cached arguments)
+    if debug_port is None:
+        debug_port = _next_debug_port()
+    chrome_options.add_argument(f"--remote-debugging-port={debug_port}")
+
+    # Randomize user agent (kept out of the cached arguments)
+    chrome_options.add_argument(f"--user-agent={random.choice(USER_AGENTS)}")
 
     # Disable automation flags
     chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
     chrome_options.add_experimental_option("useAutomationExtension", False)
 
+    # Block image loading via prefs (--disable-images alone is unreliable).
+    # SERP result links are server-rendered, so page JS is skipped too by
+    # default — V8 never parses or runs the analytics/anti-bot scripts
+    prefs = {"profile.managed_default_content_settings.images": 2}
+    if not enable_js:
+        prefs["profile.managed_default_content_settings.javascript"] = 2
+    chrome_options.add_experimental_option("prefs", prefs)
+
     # Check if CHROME_BIN is set (GitHub Actions)
     chrome_bin = os.getenv("CHROME_BIN")
     if chrome_bin:
         chrome_options.binary_location = chrome_bin
 
-    try:
-        # Try using chromedriver from PATH first (GitHub Actions)
-        driver = webdriver.Chrome(options=chrome_options)
-    except WebDriverException:
-        # Fallback to webdriver-manager
-        from webdriver_manager.chrome import ChromeDriverManager
+    return chrome_options
+
 
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+def setup_driver(headless=True, enable_js=True):
+    """Configure and return Chrome WebDriver"""
+    # Reattach to an already-running Chrome when pooling is enabled
+    if KEEP_BROWSER:
+        driver = _reconnect_driver()
+        if driver:
+            print("♻️ Reusing Chrome from previous run")
+            return driver
+
+    debug_port = _next_debug_port()
+    chrome_options = _build_options(headless, enable_js, debug_port)
+
+    if shutil.which("chromedriver"):
+        # chromedriver already on PATH (GitHub Actions) — skip any lookup
+        driver = webdriver.Chrome(options=chrome_options)
+    else:
+        try:
+            # Let Selenium resolve a locally managed driver first
+            driver = webdriver.Chrome(options=chrome_options)
+        except WebDriverException:
+            # Last resort: webdriver-manager, with the resolved path cached
+            # on disk so only the first run pays the network lookup
+            service = Service(_cached_chromedriver())
+            driver = webdriver.Chrome(service=service, options=chrome_options)
 
     # Execute CDP commands to prevent detection
     driver.execute_cdp_cmd(
@@ -88,35 +396,78 @@ def setup_driver(headless=True):
         },
     )
 
+    # Let parallel WebDriver commands run without fighting over one socket
+    _widen_command_pool(driver)
+
+    # Block images, CSS, and fonts at the network level — the scraper only
+    # reads server-rendered HTML, so skip the bytes entirely
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_RESOURCE_URLS})
+
+    # Keep implicit waits at 0 — we rely on explicit WebDriverWait, and any
+    # implicit timeout would stall every find_element miss in the hot loops
+    driver.implicitly_wait(0)
+
+    if KEEP_BROWSER:
+        _save_pool_state(driver.command_executor._url, debug_port)
+
     return driver
 
 
-def is_valid_linkedin_url(url):
-    """Check if URL is a valid LinkedIn profile URL (not a search or tracking link)"""
-    if not url:
-        return False
+def release_driver(driver):
+    """Return a driver to the pool (reset) or shut it down, per KEEP_BROWSER"""
+    if KEEP_BROWSER:
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            return
+        except WebDriverException:
+            _clear_pool_state()
 
-    # Must contain linkedin.com/in/
-    if "linkedin.com/in/" not in url:
-        return False
+    try:
+        driver.quit()
+    except Exception:
+        pass
 
-    # Exclude Google/Bing tracking or search URLs
-    invalid_patterns = [
-        "google.com",
-        "bing.com",
-        "google.com/search",
-        "google.com/finance",
-        "/search?",
-        "udm=",
-        "source=lnms",
-        "source=lnt",
-    ]
 
-    for pattern in invalid_patterns:
-        if pattern in url:
-            return False
+class DriverPool:
+    """Small pool of reusable Chrome drivers for long-running workers"""
 
-    return True
+    def __init__(self, size=1, headless=True):
+        # Remembered so a crashed driver's replacement matches the pool
+        self._headless = headless
+        self._q = queue.Queue()
+        for _ in range(size):
+            self._q.put(setup_driver(headless=headless))
+
+    def acquire(self):
+        return self._q.get()
+
+    def release(self, driver):
+        # Reset between uses instead of quitting so the browser is warm
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except WebDriverException:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            driver = setup_driver(headless=self._headless)
+        self._q.put(driver)
+
+    def close(self):
+        while not self._q.empty():
+            try:
+                self._q.get_nowait().quit()
+            except Exception:
+                pass
+
+
+def is_valid_linkedin_url(url):
+    """Check if URL is a valid LinkedIn profile URL (not a search or tracking link)"""
+    # Must contain linkedin.com/in/ and no search/tracking markers
+    return bool(url) and _LINKEDIN_PREFIX in url and _INVALID_RE.search(url) is None
 
 
 def is_valid_title(title):
@@ -125,27 +476,7 @@ def is_valid_title(title):
         return False
 
     # Exclude common noise patterns
-    noise_patterns = [
-        "AI Mode",
-        "Images",
-        "Videos",
-        "Forums",
-        "Short videos",
-        "Read more",
-        "See more",
-        "View all",
-        "More results",
-        "Next",
-        "Previous",
-        "LinkedIn Profile",  # Generic placeholder, get real names
-    ]
-
-    title_lower = title.lower().strip()
-    for pattern in noise_patterns:
-        if title_lower == pattern.lower():
-            return False
-
-    return True
+    return title.lower().strip() not in _NOISE_TITLES
 
 
 def clean_linkedin_url(url):
@@ -154,241 +485,807 @@ def clean_linkedin_url(url):
         return None
 
     # Find the linkedin.com/in/ part and extract profile URL
-    match = re.search(r"(https?://[a-z]{2,3}\.?linkedin\.com/in/[a-zA-Z0-9_-]+)", url)
+    match = _LINKEDIN_RE.search(url)
     if match:
         return match.group(1)
     return None
 
 
+def _harvest_bing_page(driver, profiles, max_results):
+    """Wait for the current Bing tab and pull its LinkedIn results"""
+    # One timestamp per page; profiles from the same page share it
+    scraped_at = datetime.now().isoformat()
+
+    # Wait on the actual result items — WebDriverWait already polls, so
+    # no fixed sleep is needed on top of it
+    try:
+        WebDriverWait(driver, 15, poll_frequency=0.2).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.b_algo"))
+        )
+    except TimeoutException:
+        print("⚠️ Timeout waiting for page to load")
+        # Try to continue anyway
+        pass
+
+    # Small jitter to stay under anti-bot radar
+    time.sleep(random.uniform(0.1, 0.3))
+
+    # Find all search result links
+    try:
+        if ASYNC_HTTP_AVAILABLE:
+            # One page_source read, then parse in selectolax's C parser —
+            # no per-element WebDriver round-trips at all
+            tree = HTMLParser(driver.page_source)
+            data = []
+            for node in tree.css("li.b_algo"):
+                a = node.css_first("a")
+                if a is None:
+                    continue
+                h2 = node.css_first("h2")
+                data.append(
+                    (a.attributes.get("href"), (h2.text() if h2 else a.text()) or "")
+                )
+            if not data:
+                # Fallback: all anchors pointing at linkedin.com/in/
+                data = [
+                    (a.attributes.get("href"), a.text() or "")
+                    for a in tree.css("a[href]")
+                    if _LINKEDIN_PREFIX in (a.attributes.get("href") or "")
+                ]
+        else:
+            # One regex pass over the raw HTML recovers every titled
+            # LinkedIn result without walking the DOM at all
+            html = driver.page_source
+            data = [
+                (m["url"], _TAG_RE.sub("", m["title"]))
+                for m in _URL_WITH_TITLE_RE.finditer(html)
+            ]
+
+            if not data:
+                # Fallback: every bare profile URL on the page
+                data = [(m.group(1), "") for m in _LINKEDIN_RE.finditer(html)]
+
+        for link, title in data:
+            # Guard first so a full store skips all per-candidate work
+            if len(profiles) >= max_results:
+                break
+            # Only get LinkedIn profile links
+            clean_link = clean_linkedin_url(link)
+            if (
+                clean_link
+                and is_valid_linkedin_url(clean_link)
+                and clean_link not in profiles
+            ):
+                title = title or ""
+                if is_valid_title(title):
+                    profiles[clean_link] = Profile(title[:100], clean_link, scraped_at)
+                    print(f"✅ Found: {title[:50]}...")
+                    if len(profiles) >= max_results:
+                        break
+
+    except Exception as e:
+        print(f"⚠️ Error parsing results: {e}")
+
+
 def scrape_bing_results(driver, query, max_results=30):
-    """Scrape LinkedIn profiles from Bing search results (more reliable than Google)"""
-    profiles = []
-    page = 0
+    """Scrape LinkedIn profiles from Bing search results (more reliable than Google).
+
+    Pages are independent, so every navigation is started up front in
+    its own tab and the tabs are harvested in order — the page loads
+    overlap instead of running back to back.
+    """
+    profiles = {}
 
-    # URL encode the query
     encoded_query = quote_plus(query)
+    # Allow up to 5 pages for Bing (less aggressive) — harvesting stops
+    # early once max_results is hit, and sparse pages are made up for by
+    # the later ones
+    pages = 5
+    urls = [
+        f"https://www.bing.com/search?q={encoded_query}&first={page * 10 + 1}"
+        for page in range(pages)
+    ]
 
-    while len(profiles) < max_results:
-        # Build Bing search URL
-        first = page * 10 + 1
-        url = f"https://www.bing.com/search?q={encoded_query}&first={first}"
+    # One tab per page (best effort — a lone tab degrades to sequential)
+    handles = [driver.current_window_handle]
+    while len(handles) < len(urls):
+        try:
+            driver.switch_to.new_window("tab")
+            handles.append(driver.current_window_handle)
+        except WebDriverException:
+            break
+
+    # Start every navigation without blocking on the loads
+    started = []
+    for handle, url in zip(handles, urls):
+        try:
+            driver.switch_to.window(handle)
+            driver.execute_cdp_cmd("Page.enable", {})
+            driver.execute_cdp_cmd("Page.navigate", {"url": url})
+            started.append(handle)
+        except WebDriverException as e:
+            print(f"⚠️ Error loading page: {e}")
+            break
+
+    for page, handle in enumerate(started):
+        if len(profiles) >= max_results:
+            break
 
         print(f"🔍 Scraping Bing page {page + 1}...")
+        driver.switch_to.window(handle)
+        _harvest_bing_page(driver, profiles, max_results)
 
+        # Check if we found any new profiles so far
+        if page > 0 and len(profiles) == 0:
+            print("⚠️ No results found, stopping...")
+            break
+
+    # Pages that never got a tab (or whose kick-off failed) are walked
+    # sequentially in the current tab — a tab shortfall costs
+    # parallelism, not results
+    for page in range(len(started), len(urls)):
+        if len(profiles) >= max_results:
+            break
+        if page > 0 and len(profiles) == 0:
+            print("⚠️ No results found, stopping...")
+            break
+        print(f"🔍 Scraping Bing page {page + 1}...")
         try:
-            driver.get(url)
+            driver.execute_cdp_cmd("Page.enable", {})
+            driver.execute_cdp_cmd("Page.navigate", {"url": urls[page]})
         except WebDriverException as e:
             print(f"⚠️ Error loading page: {e}")
             break
+        _harvest_bing_page(driver, profiles, max_results)
 
-        # Random delay to appear more human-like
-        time.sleep(random.uniform(1.5, 3))
-
-        # Wait for results to load
+    # Close the extra tabs and land back on the original one
+    for handle in handles[1:]:
         try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.ID, "b_results"))
-            )
-        except TimeoutException:
-            print("⚠️ Timeout waiting for page to load")
-            # Try to continue anyway
+            driver.switch_to.window(handle)
+            driver.close()
+        except WebDriverException:
             pass
+    try:
+        driver.switch_to.window(handles[0])
+    except WebDriverException:
+        pass
 
-        # Find all search result links
-        try:
-            # Bing uses li.b_algo for search results
-            search_results = driver.find_elements(By.CSS_SELECTOR, "li.b_algo")
+    return profiles
 
-            if not search_results:
-                # Fallback: find all links containing linkedin.com/in/
-                all_links = driver.find_elements(By.TAG_NAME, "a")
-                for link_elem in all_links:
-                    try:
-                        href = link_elem.get_attribute("href")
-                        clean_url = clean_linkedin_url(href)
-                        if (
-                            clean_url
-                            and is_valid_linkedin_url(clean_url)
-                            and not any(p["link"] == clean_url for p in profiles)
-                        ):
-                            text = link_elem.text or ""
-                            if is_valid_title(text):
-                                profiles.append(
-                                    {
-                                        "title": text[:100],
-                                        "link": clean_url,
-                                        "scraped_at": datetime.now().isoformat(),
-                                    }
-                                )
-                                print(f"✅ Found: {text[:50]}...")
-                                if len(profiles) >= max_results:
-                                    break
-                    except:
-                        continue
+
+async def fetch_page(session, url, sem):
+    """Fetch a single search page over HTTP, bounded by the shared semaphore"""
+    async with sem:
+        async with session.get(
+            url, timeout=aiohttp.ClientTimeout(total=15)
+        ) as response:
+            return await response.text()
+
+
+async def _fetch_pages(urls):
+    """Fetch a batch of URLs concurrently with one shared session"""
+    sem = asyncio.BoundedSemaphore(FETCH_CONCURRENCY)
+    headers = {"User-Agent": random.choice(USER_AGENTS)}
+
+    async with aiohttp.ClientSession(headers=headers) as session:
+        return await asyncio.gather(
+            *[fetch_page(session, url, sem) for url in urls],
+            return_exceptions=True,
+        )
+
+
+def fetch_google_pages(query, pages):
+    """Fetch all Google result pages concurrently without a browser"""
+    encoded_query = quote_plus(query)
+    return asyncio.run(
+        _fetch_pages(
+            [
+                f"https://www.google.com/search?q={encoded_query}&start={page * 10}&num=10"
+                for page in range(pages)
+            ]
+        )
+    )
+
+
+def fetch_bing_pages(query, pages):
+    """Fetch all Bing result pages concurrently without a browser"""
+    encoded_query = quote_plus(query)
+    return asyncio.run(
+        _fetch_pages(
+            [
+                f"https://www.bing.com/search?q={encoded_query}&first={page * 10 + 1}"
+                for page in range(pages)
+            ]
+        )
+    )
+
+
+def scrape_bing_http(query, max_results=30):
+    """Scrape LinkedIn profiles from Bing over plain HTTP (no browser).
+
+    Returns None if Bing challenges the client (CAPTCHA / block page),
+    so the caller can fall back to the Selenium path.
+    """
+    profiles = {}
+    # Five pages like the browser path — they fetch concurrently, and
+    # sparse pages are made up for by the later ones
+    pages = 5
+
+    print(f"🔍 Fetching {pages} Bing page(s) over HTTP...")
+
+    for html in fetch_bing_pages(query, pages):
+        if isinstance(html, Exception):
+            print(f"⚠️ Error fetching page: {html}")
+            continue
+
+        lowered = html.lower()
+        if "captcha" in lowered or "unusual traffic" in lowered:
+            print("⚠️ Bing challenged the HTTP fetch")
+            return None  # Signal to fall back to the browser
+
+        # One timestamp per page; profiles from the same fetch share it
+        scraped_at = datetime.now().isoformat()
+
+        tree = HTMLParser(html)
+        results = tree.css("li.b_algo")
+        if results:
+            pairs = (
+                (
+                    node.css_first("a"),
+                    node.css_first("h2"),
+                )
+                for node in results
+            )
+            candidates = (
+                (a.attributes.get("href"), (h2.text() if h2 else a.text(strip=True)))
+                for a, h2 in pairs
+                if a
+            )
+        else:
+            # Fallback: all anchors on the page
+            candidates = (
+                (node.attributes.get("href"), node.text(strip=True))
+                for node in tree.css("a[href]")
+            )
+
+        for href, title in candidates:
+            if len(profiles) >= max_results:
+                return profiles
+            clean_url = clean_linkedin_url(href)
+            if (
+                clean_url
+                and is_valid_linkedin_url(clean_url)
+                and clean_url not in profiles
+            ):
+                title = title or ""
+                if is_valid_title(title):
+                    profiles[clean_url] = Profile(title[:100], clean_url, scraped_at)
+                    print(f"✅ Found: {title[:50]}...")
+                    if len(profiles) >= max_results:
+                        return profiles
+
+    return profiles
+
+
+async def _scrape_bing_playwright(query, max_results):
+    """Fetch and harvest every Bing page concurrently on async Chromium"""
+    encoded_query = quote_plus(query)
+    # Five pages like the other Bing paths; they load concurrently
+    pages_n = 5
+    urls = [
+        f"https://www.bing.com/search?q={encoded_query}&first={page * 10 + 1}"
+        for page in range(pages_n)
+    ]
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context(user_agent=random.choice(USER_AGENTS))
+
+        # Route-level blocking: non-document resources never leave the queue
+        async def _route(route):
+            if route.request.resource_type in {"image", "stylesheet", "font", "media"}:
+                await route.abort()
             else:
-                for result in search_results:
-                    try:
-                        # Try to find the link
-                        link_element = result.find_element(By.CSS_SELECTOR, "a")
-                        link = link_element.get_attribute("href")
-
-                        # Only get LinkedIn profile links
-                        clean_link = clean_linkedin_url(link)
-                        if clean_link and is_valid_linkedin_url(clean_link):
-
-                            try:
-                                title_element = result.find_element(
-                                    By.CSS_SELECTOR, "h2"
-                                )
-                                title = title_element.text
-                            except NoSuchElementException:
-                                try:
-                                    title = link_element.text
-                                except:
-                                    title = ""
-
-                            if is_valid_title(title):
-                                profile = {
-                                    "title": title[:100],
-                                    "link": clean_link,
-                                    "scraped_at": datetime.now().isoformat(),
-                                }
-
-                                # Avoid duplicates
-                                if not any(p["link"] == clean_link for p in profiles):
-                                    profiles.append(profile)
-                                    print(
-                                        f"✅ Found: {title[:50] if title else 'Profile'}..."
-                                    )
-
-                                if len(profiles) >= max_results:
-                                    break
-
-                    except NoSuchElementException:
-                        continue
+                await route.continue_()
 
-        except Exception as e:
-            print(f"⚠️ Error parsing results: {e}")
+        await context.route("**/*", _route)
 
-        # Check if we found any new profiles on this page
-        if page > 0 and len(profiles) == 0:
-            print("⚠️ No results found, stopping...")
-            break
+        async def scrape_page(url):
+            page = await context.new_page()
+            try:
+                await page.goto(url, wait_until="domcontentloaded")
+                # One IPC call maps every result to [href, title]
+                return await page.eval_on_selector_all(
+                    "li.b_algo",
+                    "els => els.map(r => {"
+                    " const a = r.querySelector('a');"
+                    " const h2 = r.querySelector('h2');"
+                    " return [a ? a.href : null,"
+                    "         h2 ? h2.innerText : (a ? a.innerText : '')];"
+                    "})",
+                )
+            finally:
+                await page.close()
+
+        results = await asyncio.gather(
+            *(scrape_page(url) for url in urls), return_exceptions=True
+        )
+        await browser.close()
+
+    profiles = {}
+    scraped_at = datetime.now().isoformat()
+    for data in results:
+        if isinstance(data, Exception):
+            print(f"⚠️ Playwright page failed: {data}")
+            continue
+        for link, title in data:
+            if len(profiles) >= max_results:
+                return profiles
+            clean_link = clean_linkedin_url(link)
+            if (
+                clean_link
+                and is_valid_linkedin_url(clean_link)
+                and clean_link not in profiles
+            ):
+                title = title or ""
+                if is_valid_title(title):
+                    profiles[clean_link] = Profile(title[:100], clean_link, scraped_at)
+                    print(f"✅ Found: {title[:50]}...")
+                    if len(profiles) >= max_results:
+                        return profiles
+    return profiles
 
-        # Check for "next" button or if we've hit the limit
-        page += 1
-        if page >= 5:  # Allow up to 5 pages for Bing (less aggressive)
-            break
 
-        # Random delay between pages
-        time.sleep(random.uniform(2, 4))
+def scrape_bing_playwright(query, max_results=30):
+    """Browser-grade Bing scrape without Selenium's per-command overhead"""
+    return asyncio.run(_scrape_bing_playwright(query, max_results))
+
+
+def scrape_google_http(query, max_results=30):
+    """Scrape LinkedIn profiles from Google over plain HTTP (no browser).
+
+    Returns None if Google challenges us (CAPTCHA / unusual traffic), so the
+    caller can fall back to the Selenium path.
+    """
+    profiles = {}
+    pages = max(1, min(3, (max_results + 9) // 10))
+
+    print(f"🔍 Fetching {pages} Google page(s) over HTTP...")
+
+    for html in fetch_google_pages(query, pages):
+        if isinstance(html, Exception):
+            print(f"⚠️ Error fetching page: {html}")
+            continue
+
+        lowered = html.lower()
+        if "captcha" in lowered or "unusual traffic" in lowered:
+            print("⚠️ Google challenged the HTTP fetch")
+            return None  # Signal to fall back to the browser
+
+        # One timestamp per page; profiles from the same fetch share it
+        scraped_at = datetime.now().isoformat()
+
+        tree = HTMLParser(html)
+        # Prefer organic result blocks, fall back to all anchors
+        links = tree.css("div.g a[href]") or tree.css("a[href]")
+        for node in links:
+            if len(profiles) >= max_results:
+                return profiles
+            href = node.attributes.get("href")
+            clean_url = clean_linkedin_url(href)
+            if (
+                clean_url
+                and is_valid_linkedin_url(clean_url)
+                and clean_url not in profiles
+            ):
+                text = node.text(strip=True) or ""
+                if is_valid_title(text):
+                    profiles[clean_url] = Profile(text[:100], clean_url, scraped_at)
+                    print(f"✅ Found: {text[:50]}...")
+                    if len(profiles) >= max_results:
+                        return profiles
 
     return profiles
 
 
 def scrape_google_results(driver, query, max_results=30):
     """Fallback: Scrape LinkedIn profiles from Google search results"""
-    profiles = []
-    page = 0
+    # Fast path: direct HTTP fetches, no browser involved
+    if ASYNC_HTTP_AVAILABLE:
+        profiles = scrape_google_http(query, max_results)
+        if profiles is not None:
+            return profiles
+        print("🔄 Falling back to browser for Google...")
 
-    # URL encode the query
-    encoded_query = quote_plus(query)
+    return _scrape_google_selenium(driver, query, max_results)
 
-    while len(profiles) < max_results:
-        start = page * 10
-        url = f"https://www.google.com/search?q={encoded_query}&start={start}&num=10"
 
-        print(f"🔍 Scraping Google page {page + 1}...")
+def _wait_page_interactive(driver, timeout=10):
+    """Poll readyState until the document is parseable ("interactive").
+
+    driver.get blocks until the full load event, which on search pages
+    includes tracking beacons and late async scripts the scraper never
+    uses; the server-rendered anchors exist as soon as the HTML parses.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            state = driver.execute_cdp_cmd(
+                "Runtime.evaluate", {"expression": "document.readyState"}
+            )["result"]["value"]
+        except WebDriverException:
+            state = None
+        if state in ("interactive", "complete"):
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _harvest_google_page(driver, profiles, max_results):
+    """Pull LinkedIn anchors out of the current tab in one script call"""
+    # One timestamp per page; profiles from the same page share it
+    scraped_at = datetime.now().isoformat()
+
+    try:
+        if ASYNC_HTTP_AVAILABLE:
+            # One page_source read parsed in C, no per-element round-trips
+            tree = HTMLParser(driver.page_source)
+            data = [
+                (a.text() or "", a.attributes.get("href"))
+                for a in tree.css("a[href]")
+                if _LINKEDIN_PREFIX in (a.attributes.get("href") or "")
+            ]
+        else:
+            # Filter inside V8 so non-LinkedIn anchors never cross the
+            # WebDriver boundary
+            data = driver.execute_script(
+                "return Array.from(document.querySelectorAll('a[href]'))"
+                f".filter(a => a.href.includes('{_LINKEDIN_PREFIX}'))"
+                ".map(a => [a.innerText, a.href]);"
+            )
+        for text, href in data:
+            # Guard first so a full store skips all per-candidate work
+            if len(profiles) >= max_results:
+                break
+            clean_url = clean_linkedin_url(href)
+            if (
+                clean_url
+                and is_valid_linkedin_url(clean_url)
+                and clean_url not in profiles
+            ):
+                text = text or ""
+                if is_valid_title(text):
+                    profiles[clean_url] = Profile(text[:100], clean_url, scraped_at)
+                    print(f"✅ Found: {text[:50]}...")
+                    if len(profiles) >= max_results:
+                        break
 
+    except Exception as e:
+        print(f"⚠️ Error parsing results: {e}")
+
+
+def _scrape_google_selenium(driver, query, max_results=30):
+    """Browser-based Google scrape, used when the HTTP path is challenged.
+
+    Opens one tab per result page and kicks off every navigation before
+    harvesting, so the network round-trips overlap instead of running
+    back to back.
+    """
+    profiles = {}
+
+    encoded_query = quote_plus(query)
+    pages = max(1, min(3, (max_results + 9) // 10))
+    urls = [
+        f"https://www.google.com/search?q={encoded_query}&start={page * 10}&num=10"
+        for page in range(pages)
+    ]
+
+    # One tab per page (best effort — a lone tab degrades to sequential)
+    handles = [driver.current_window_handle]
+    while len(handles) < len(urls):
         try:
-            driver.get(url)
+            driver.switch_to.new_window("tab")
+            handles.append(driver.current_window_handle)
+        except WebDriverException:
+            break
+
+    # Start every navigation without blocking on the loads
+    started = []
+    for handle, url in zip(handles, urls):
+        try:
+            driver.switch_to.window(handle)
+            driver.execute_cdp_cmd("Page.enable", {})
+            driver.execute_cdp_cmd("Page.navigate", {"url": url})
+            started.append(handle)
         except WebDriverException as e:
             print(f"⚠️ Error loading page: {e}")
             break
 
-        time.sleep(random.uniform(2, 4))
+    blocked = False
+    for page, handle in enumerate(started):
+        if len(profiles) >= max_results:
+            break
 
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
-        except TimeoutException:
+        print(f"🔍 Scraping Google page {page + 1}...")
+        driver.switch_to.window(handle)
+
+        # Parse as soon as the HTML is in, not when the load event fires
+        if not _wait_page_interactive(driver):
             print("⚠️ Timeout waiting for page to load")
+            continue
+
+        # Check if we hit a CAPTCHA or block — a boolean probe in the page
+        # instead of shipping the whole DOM over the wire to search it
+        if driver.execute_script(
+            "return document.title.toLowerCase().includes('unusual')"
+            " || !!document.querySelector('#captcha-form, #recaptcha');"
+        ):
+            print("⚠️ Google detected automation, trying Bing instead...")
+            blocked = True
             break
 
-        # Check if we hit a CAPTCHA or block
-        page_source = driver.page_source.lower()
-        if "captcha" in page_source or "unusual traffic" in page_source:
+        _harvest_google_page(driver, profiles, max_results)
+
+    # Pages that never got a tab (or whose kick-off failed) are walked
+    # sequentially in the current tab — a tab shortfall costs
+    # parallelism, not results
+    for page in range(len(started), len(urls)):
+        if blocked or len(profiles) >= max_results:
+            break
+        print(f"🔍 Scraping Google page {page + 1}...")
+        try:
+            driver.execute_cdp_cmd("Page.enable", {})
+            driver.execute_cdp_cmd("Page.navigate", {"url": urls[page]})
+        except WebDriverException as e:
+            print(f"⚠️ Error loading page: {e}")
+            break
+        if not _wait_page_interactive(driver):
+            print("⚠️ Timeout waiting for page to load")
+            continue
+        if driver.execute_script(
+            "return document.title.toLowerCase().includes('unusual')"
+            " || !!document.querySelector('#captcha-form, #recaptcha');"
+        ):
             print("⚠️ Google detected automation, trying Bing instead...")
-            return None  # Signal to try Bing
+            blocked = True
+            break
+        _harvest_google_page(driver, profiles, max_results)
 
-        # Find all links containing linkedin.com/in/
+    # Close the extra tabs and land back on the original one
+    for handle in handles[1:]:
         try:
-            all_links = driver.find_elements(By.TAG_NAME, "a")
-            for link_elem in all_links:
-                try:
-                    href = link_elem.get_attribute("href")
-                    clean_url = clean_linkedin_url(href)
-                    if (
-                        clean_url
-                        and is_valid_linkedin_url(clean_url)
-                        and not any(p["link"] == clean_url for p in profiles)
-                    ):
-                        text = link_elem.text or ""
-                        if is_valid_title(text):
-                            profiles.append(
-                                {
-                                    "title": text[:100],
-                                    "link": clean_url,
-                                    "scraped_at": datetime.now().isoformat(),
-                                }
-                            )
-                            print(f"✅ Found: {text[:50]}...")
-                            if len(profiles) >= max_results:
-                                break
-                except:
-                    continue
+            driver.switch_to.window(handle)
+            driver.close()
+        except WebDriverException:
+            pass
+    try:
+        driver.switch_to.window(handles[0])
+    except WebDriverException:
+        pass
 
-        except Exception as e:
-            print(f"⚠️ Error parsing results: {e}")
+    if blocked:
+        return None  # Signal to try Bing
 
-        page += 1
-        if page >= 3:
-            break
+    return profiles
 
-        time.sleep(random.uniform(3, 6))
 
-    return profiles
+class CsvSink:
+    """CSV writer that keeps one open file handle across page batches.
+
+    Avoids the stat + reopen cost of re-entering the file per page and
+    flushes after each batch so partial results survive a crash.
+    """
+
+    def __init__(self, filename, mode="a"):
+        self.filename = filename
+        self.mode = mode
+        self._file = None
+        self._writer = None
+
+    def __enter__(self):
+        self._file = open(self.filename, self.mode, newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        # Header only when starting from an empty file
+        if self._file.tell() == 0:
+            self._writer.writerow(CSV_FIELDS)
+        return self
+
+    def write_batch(self, rows):
+        # Attribute tuples straight into the C csv writer — no dict or
+        # recursive-copy machinery per row
+        self._writer.writerows((row.title, row.link, row.scraped_at) for row in rows)
+        self._file.flush()
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        self._file = None
+        self._writer = None
+
+
+def _iter_rows(profiles):
+    """Yield Profile rows from either a URL-keyed dict or an iterable"""
+    return profiles.values() if isinstance(profiles, dict) else profiles
 
 
 def save_to_csv(profiles, filename):
     """Save scraped profiles to CSV file"""
     if not profiles:
         print("⚠️ No profiles to save, creating empty file...")
-        # Create empty CSV with headers
-        with open(filename, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=["title", "link", "scraped_at"])
-            writer.writeheader()
-        return
 
-    # Write new results (overwrite to avoid duplicates over time)
-    with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["title", "link", "scraped_at"])
-        writer.writeheader()
-        writer.writerows(profiles)
+    # Overwrite to avoid duplicates accumulating over time
+    with CsvSink(filename, mode="w") as sink:
+        if profiles:
+            sink.write_batch(_iter_rows(profiles))
+
+    if profiles:
+        print(f"💾 Saved {len(profiles)} profiles to {filename}")
+
+
+def save_to_jsonl(profiles, filename):
+    """Append scraped profiles to a JSONL file, one object per line.
+
+    Unlike CSV, JSONL lines can be appended from concurrent producers
+    without a shared writer or quoting logic.
+    """
+    with open(filename, "a", encoding="utf-8") as f:
+        for row in _iter_rows(profiles):
+            f.write(
+                _json_dumps(
+                    {
+                        "title": row.title,
+                        "link": row.link,
+                        "scraped_at": row.scraped_at,
+                    }
+                )
+                + "\n"
+            )
+
+    print(f"💾 Appended {len(profiles)} profiles to {filename}")
+
+
+def _merge_profiles(profiles, new_profiles):
+    """Insert rows whose link is not already a key; return what was added.
+
+    The URL-keyed dict is both the store and the duplicate check, so a
+    merge is one hash lookup per row.
+    """
+    added = []
+    for row in _iter_rows(new_profiles or {}):
+        if row.link not in profiles:
+            profiles[row.link] = row
+            added.append(row)
+    return added
+
+
+def serve_forever():
+    """Serve mode: read one search query per stdin line, reusing drivers.
+
+    A long-running worker amortizes Chrome startup across queries: each
+    query borrows a warm driver from the pool, which is reset (cookies
+    cleared, about:blank) instead of quit between uses. Results land in
+    one CSV per query.
+    """
+    headless = os.getenv("HEADLESS", "true").lower() == "true"
+    pool = DriverPool(size=int(os.getenv("POOL_SIZE", "1")), headless=headless)
+    print("👂 Serve mode: one search query per line (Ctrl-D to exit)")
+
+    try:
+        for line in sys.stdin:
+            query = line.strip()
+            if not query:
+                continue
+
+            driver = pool.acquire()
+            try:
+                profiles = scrape_bing_results(driver, query, MAX_RESULTS)
+            finally:
+                pool.release(driver)
+
+            filename = re.sub(r"\W+", "_", query).strip("_")[:50] + ".csv"
+            save_to_csv(profiles, filename)
+    finally:
+        pool.close()
+
+    return 0
+
+
+def run_one_query(query):
+    """Pool worker: scrape one query with its own browser, return the rows"""
+    profiles = None
+    if ASYNC_HTTP_AVAILABLE:
+        try:
+            profiles = scrape_bing_http(query, MAX_RESULTS)
+        except Exception as e:
+            print(f"⚠️ HTTP scrape failed for '{query}': {e}")
+    if profiles:
+        return list(profiles.values())
+
+    driver = None
+    try:
+        driver = setup_driver(headless=True)
+        profiles = scrape_bing_results(driver, query, MAX_RESULTS)
+    except Exception as e:
+        print(f"⚠️ Scraping error for '{query}': {e}")
+        profiles = {}
+    finally:
+        if driver:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+    return list(profiles.values())
+
+
+def _output_filename():
+    """OUTPUT_FILE, made unique per run when USE_TIMESTAMP is on"""
+    if not USE_TIMESTAMP:
+        return OUTPUT_FILE
+    base_name = OUTPUT_FILE.rsplit(".", 1)[0]
+    extension = OUTPUT_FILE.rsplit(".", 1)[1] if "." in OUTPUT_FILE else "csv"
+    timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{base_name}_{timestamp_str}.{extension}"
+
 
-    print(f"💾 Saved {len(profiles)} profiles to {filename}")
+def _run_queries_parallel(queries):
+    """Scrape several queries at once, one browser per worker process.
+
+    WebDriver sessions cannot be shared across threads, so fan-out uses
+    processes; maxtasksperchild recycles each worker (and its Chrome)
+    before memory creeps up.
+    """
+    workers = min(4, len(queries))
+    print(f"🔀 Running {len(queries)} queries across {workers} workers")
+
+    output_file = _output_filename()
+
+    # Seed from the cache like the single-query path
+    cache = None
+    profiles = {}
+    if USE_PROFILE_CACHE:
+        try:
+            cache = ProfileCache()
+        except Exception as e:
+            print(f"⚠️ Profile cache unavailable: {e}")
+    if cache:
+        cached = cache.recent(MAX_RESULTS, max_age_hours=CACHE_MAX_AGE_HOURS)
+        profiles = {p[1]: Profile(*p) for p in cached}
+        if profiles:
+            print(f"⚡ Loaded {len(profiles)} fresh profiles from cache")
+
+    with multiprocessing.Pool(workers, maxtasksperchild=5) as pool:
+        for rows in pool.map(run_one_query, queries):
+            _merge_profiles(profiles, rows)
+
+    save_to_csv(profiles, output_file)
+    if OUTPUT_JSONL and profiles:
+        save_to_jsonl(profiles, output_file.rsplit(".", 1)[0] + ".jsonl")
+    if USE_TIMESTAMP and output_file != OUTPUT_FILE:
+        save_to_csv(profiles, OUTPUT_FILE)
+
+    if cache:
+        try:
+            cache.add_many((p.title, p.link, p.scraped_at) for p in profiles.values())
+            cache.close()
+        except Exception as e:
+            print(f"⚠️ Failed to update profile cache: {e}")
+
+    print("\n✅ Scraping completed!")
+    return 0
 
 
 def main():
     """Main function to run the scraper"""
+    # Long-running workers feed queries over stdin instead of one-shot env
+    if os.getenv("SERVE_MODE"):
+        return serve_forever()
+
+    # A comma-separated SEARCH_QUERY fans out one worker process per query
+    queries = [q.strip() for q in SEARCH_QUERY.split(",") if q.strip()]
+    if len(queries) > 1:
+        return _run_queries_parallel(queries)
+
     # Generate unique filename with timestamp if enabled
-    output_file = OUTPUT_FILE
-    if USE_TIMESTAMP:
-        base_name = OUTPUT_FILE.rsplit(".", 1)[0]
-        extension = OUTPUT_FILE.rsplit(".", 1)[1] if "." in OUTPUT_FILE else "csv"
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_file = f"{base_name}_{timestamp_str}.{extension}"
+    output_file = _output_filename()
 
     print("=" * 50)
     print("🤖 LinkedIn Profile Scraper Bot")
@@ -399,48 +1296,135 @@ def main():
     print("=" * 50)
 
     driver = None
-    profiles = []
+    # Keyed by clean profile URL — insertion is the duplicate check
+    profiles = {}
 
-    try:
-        # Setup driver (headless mode for cloud deployment)
-        headless = os.getenv("HEADLESS", "true").lower() == "true"
-        print(f"🖥️ Headless mode: {headless}")
-
-        driver = setup_driver(headless=headless)
-        print("✅ Chrome driver initialized successfully")
-
-        # Try Bing first (more reliable), fallback to Google
-        print("\n🔎 Using Bing search (more reliable)...")
-        profiles = scrape_bing_results(driver, SEARCH_QUERY, MAX_RESULTS)
-
-        # If Bing didn't find enough results, try Google as fallback
-        if len(profiles) < 5:
-            print("\n🔄 Trying Google as fallback...")
-            google_profiles = scrape_google_results(
-                driver, SEARCH_QUERY, MAX_RESULTS - len(profiles)
-            )
-            if google_profiles:
+    # Serve what earlier runs already found before touching the network
+    cache = None
+    if USE_PROFILE_CACHE:
+        try:
+            cache = ProfileCache()
+        except Exception as e:
+            print(f"⚠️ Profile cache unavailable: {e}")
+
+    if cache:
+        cached = cache.recent(MAX_RESULTS, max_age_hours=CACHE_MAX_AGE_HOURS)
+        profiles = {p[1]: Profile(*p) for p in cached}
+        if profiles:
+            print(f"⚡ Loaded {len(profiles)} fresh profiles from cache")
+        if len(profiles) >= MAX_RESULTS:
+            print("⚡ Cache satisfies the run, skipping scrape")
+            cache.close()
+            save_to_csv(profiles, output_file)
+            if OUTPUT_JSONL:
+                save_to_jsonl(profiles, output_file.rsplit(".", 1)[0] + ".jsonl")
+            if USE_TIMESTAMP and output_file != OUTPUT_FILE:
+                save_to_csv(profiles, OUTPUT_FILE)
+            print("\n✅ Scraping completed!")
+            return 0
+
+    # Stream results into one open CSV handle as each source delivers,
+    # so partial progress survives a crash and nothing is buffered twice
+    with CsvSink(output_file, mode="w") as sink:
+        if profiles:
+            # Seed rows served from the cache go out immediately
+            sink.write_batch(profiles.values())
+
+        try:
+            # Setup driver (headless mode for cloud deployment)
+            headless = os.getenv("HEADLESS", "true").lower() == "true"
+            print(f"🖥️ Headless mode: {headless}")
+
+            # Bing over plain HTTP first — no browser process needed at all
+            if ASYNC_HTTP_AVAILABLE:
+                print("\n🔎 Using Bing search (HTTP)...")
+                http_profiles = scrape_bing_http(
+                    SEARCH_QUERY, MAX_RESULTS - len(profiles)
+                )
+                if http_profiles is None:
+                    print("🔄 Bing challenged the HTTP fetch, using the browser...")
+                else:
+                    sink.write_batch(_merge_profiles(profiles, http_profiles))
+
+            # Playwright next: still a real browser, but async and
+            # without the WebDriver HTTP hop per command
+            if len(profiles) < 5 and PLAYWRIGHT_AVAILABLE:
+                print("\n🎭 Using Bing search (Playwright)...")
+                try:
+                    pw_profiles = scrape_bing_playwright(
+                        SEARCH_QUERY, MAX_RESULTS - len(profiles)
+                    )
+                    sink.write_batch(_merge_profiles(profiles, pw_profiles))
+                except Exception as e:
+                    print(f"⚠️ Playwright scrape failed: {e}")
+
+            # Boot Chrome only when the lighter paths were challenged or
+            # came up short
+            if len(profiles) < 5:
+                driver = setup_driver(headless=headless, enable_js=False)
+                print("✅ Chrome driver initialized successfully")
+
+                # Try Bing first (more reliable), fallback to Google
+                print("\n🔎 Using Bing search (more reliable)...")
+                bing_profiles = scrape_bing_results(
+                    driver, SEARCH_QUERY, MAX_RESULTS - len(profiles)
+                )
+
+                if not bing_profiles:
+                    # Rare JS-only SERP variant: redo the sweep once with
+                    # scripting back on
+                    print("🔄 Empty page without JS, retrying with JS enabled...")
+                    try:
+                        driver.quit()
+                    except WebDriverException:
+                        pass
+                    driver = setup_driver(headless=headless)
+                    bing_profiles = scrape_bing_results(
+                        driver, SEARCH_QUERY, MAX_RESULTS - len(profiles)
+                    )
+
+                sink.write_batch(_merge_profiles(profiles, bing_profiles))
+
+            # If Bing didn't find enough results, try Google as fallback
+            if len(profiles) < 5:
+                print("\n🔄 Trying Google as fallback...")
+                google_profiles = scrape_google_results(
+                    driver, SEARCH_QUERY, MAX_RESULTS - len(profiles)
+                )
                 # Add any new profiles from Google
-                for p in google_profiles:
-                    if not any(existing["link"] == p["link"] for existing in profiles):
-                        profiles.append(p)
+                sink.write_batch(_merge_profiles(profiles, google_profiles))
 
-        print(f"\n📊 Total profiles found: {len(profiles)}")
+            print(f"\n📊 Total profiles found: {len(profiles)}")
 
-    except Exception as e:
-        print(f"⚠️ Scraping error (non-fatal): {e}")
-        # Don't raise, continue to save whatever we have
+        except Exception as e:
+            print(f"⚠️ Scraping error (non-fatal): {e}")
+            # Don't raise, continue to save whatever we have
 
-    finally:
-        if driver:
-            try:
-                driver.quit()
-                print("🔒 Browser closed")
-            except:
-                pass
+        finally:
+            if driver:
+                try:
+                    release_driver(driver)
+                    print(
+                        "♻️ Browser kept alive" if KEEP_BROWSER else "🔒 Browser closed"
+                    )
+                except WebDriverException:
+                    pass
+
+    if profiles:
+        print(f"💾 Saved {len(profiles)} profiles to {output_file}")
+    else:
+        print("⚠️ No profiles found, output file has headers only")
+
+    # Remember everything found so later runs can skip the search engines
+    if cache:
+        try:
+            cache.add_many((p.title, p.link, p.scraped_at) for p in profiles.values())
+            cache.close()
+        except Exception as e:
+            print(f"⚠️ Failed to update profile cache: {e}")
 
-    # Always save results (even if empty) - this ensures the workflow succeeds
-    save_to_csv(profiles, output_file)
+    if OUTPUT_JSONL and profiles:
+        save_to_jsonl(profiles, output_file.rsplit(".", 1)[0] + ".jsonl")
 
     # Also create/update the main file for workflow
     if USE_TIMESTAMP and output_file != OUTPUT_FILE:
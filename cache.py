@@ -0,0 +1,55 @@
+"""
+Persistent profile cache for the LinkedIn scraper bot
+Lets repeat runs serve already-discovered profiles without re-querying
+the search engines
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+CACHE_DB = os.getenv("PROFILE_CACHE_DB", "profile_cache.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    normalized_url TEXT PRIMARY KEY,
+    title TEXT,
+    scraped_at TEXT
+)
+"""
+
+
+class ProfileCache:
+    """SQLite-backed store of profiles keyed by cleaned profile URL"""
+
+    def __init__(self, path=None):
+        self._conn = sqlite3.connect(path or CACHE_DB)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def known_urls(self):
+        """Every URL a previous run has seen, for preloading a seen set"""
+        rows = self._conn.execute("SELECT normalized_url FROM profiles")
+        return {row[0] for row in rows}
+
+    def recent(self, limit, max_age_hours=24):
+        """Freshest cached rows as (title, link, scraped_at) tuples"""
+        cutoff = (datetime.now() - timedelta(hours=max_age_hours)).isoformat()
+        rows = self._conn.execute(
+            "SELECT title, normalized_url, scraped_at FROM profiles"
+            " WHERE scraped_at >= ? ORDER BY scraped_at DESC LIMIT ?",
+            (cutoff, limit),
+        )
+        return [tuple(row) for row in rows]
+
+    def add_many(self, profiles):
+        """Record (title, link, scraped_at) rows; known URLs are kept as-is"""
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO profiles (normalized_url, title, scraped_at)"
+            " VALUES (?, ?, ?)",
+            ((link, title, scraped_at) for title, link, scraped_at in profiles),
+        )
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()